@@ -1,24 +1,50 @@
 from __future__ import annotations
 
+import bisect
+import itertools
 import json
 import logging
 import random
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Any, Dict, List, TypeVar
 
 from pytorch_ie import Dataset, IterableDataset
-from pytorch_ie.annotations import BinaryRelation
+from pytorch_ie.annotations import BinaryRelation, Span
 from pytorch_ie.core import Document
 from pytorch_ie.data.common import EnterDatasetMixin, ExitDatasetMixin
-from pytorch_ie.utils.span import is_contained_in
 
-from pie_utils.span.slice import distance
+from pie_utils.span.slice import get_distance_function
 
 logger = logging.getLogger(__name__)
 
 D = TypeVar("D", bound=Document)
 
 
+def _get_entities_per_partition(entities: list[Span], partitions: list[Span]) -> list[list[Span]]:
+    """Collect the entities that are contained in each partition. The partitions are sorted by
+    their start once, so that each entity is checked only against the partitions that start before
+    it (found via bisection) instead of against all partitions.
+
+    :param entities: the entities to assign to the partitions
+    :param partitions: the partitions, they may overlap
+    :return: a list with the contained entities (in their original order) for each partition
+    """
+    entities_per_partition: list[list[Span]] = [[] for _ in partitions]
+    sorted_indices = sorted(range(len(partitions)), key=lambda idx: partitions[idx].start)
+    starts = [partitions[idx].start for idx in sorted_indices]
+    # max_ends[i] is the maximal end of all partitions that are sorted before (or at) position i
+    max_ends = list(itertools.accumulate((partitions[idx].end for idx in sorted_indices), max))
+    for entity in entities:
+        i = bisect.bisect_right(starts, entity.start) - 1
+        # walk back only as long as there may be a partition that ends not before the entity
+        while i >= 0 and max_ends[i] >= entity.end:
+            partition_idx = sorted_indices[i]
+            if entity.end <= partitions[partition_idx].end:
+                entities_per_partition[partition_idx].append(entity)
+            i -= 1
+    return entities_per_partition
+
+
 class CandidateRelationAdder(EnterDatasetMixin, ExitDatasetMixin):
     """CandidateRelationAdder adds binary relations to a document based on various parameters. It
     goes through combinations of available entity pairs as possible candidates for new relations.
@@ -90,6 +116,7 @@ class CandidateRelationAdder(EnterDatasetMixin, ExitDatasetMixin):
         self.partition_layer = partition_layer
         self.max_distance = max_distance
         self.distance_type = distance_type
+        self._distance = get_distance_function(distance_type)
         self.collect_statistics = collect_statistics
         self.sort_by_distance = sort_by_distance
         self.n_max = n_max
@@ -136,47 +163,44 @@ class CandidateRelationAdder(EnterDatasetMixin, ExitDatasetMixin):
             rel_layer = rel_layer.predictions
 
         available_relation_mapping = {(rel.head, rel.tail): rel for rel in rel_layer}
-        if self.partition_layer is not None:
-            available_partitions = document[self.partition_layer]
-        else:
-            available_partitions = [None]
 
         entity_layer = rel_layer.target_layer
         if self.use_predictions:
             entity_layer = entity_layer.predictions
 
+        if self.partition_layer is not None:
+            entities_per_partition = _get_entities_per_partition(
+                entities=list(entity_layer), partitions=list(document[self.partition_layer])
+            )
+        else:
+            entities_per_partition = [list(entity_layer)]
+
+        distance_func = self._distance
+        max_distance = self.max_distance
+        collect_statistics = self.collect_statistics
         candidates_with_distance = {}
         distances_taken = defaultdict(list)
-        num_relations_in_partition = 0
+        num_available_rels_within_allowed_distance = 0
         available_rels_within_allowed_distance = set()
-        for partition in available_partitions:
-            if partition is not None:
-                available_entities = [
-                    entity
-                    for entity in entity_layer
-                    if is_contained_in(
-                        (entity.start, entity.end), (partition.start, partition.end)
-                    )
-                ]
-            else:
-                available_entities = list(entity_layer)
-            for head in available_entities:
-                for tail in available_entities:
+        for available_entities in entities_per_partition:
+            # no entity pairs can be created from less than two entities
+            if len(available_entities) < 2:
+                continue
+            # get the offsets once per entity instead of once per entity pair
+            entity_spans = [(entity.start, entity.end) for entity in available_entities]
+            for head, head_span in zip(available_entities, entity_spans):
+                for tail, tail_span in zip(available_entities, entity_spans):
                     if head == tail:
                         continue
-                    d = distance(
-                        (head.start, head.end),
-                        (tail.start, tail.end),
-                        self.distance_type,
-                    )
-                    if self.max_distance is not None and d > self.max_distance:
+                    d = distance_func(head_span, tail_span)
+                    if max_distance is not None and d > max_distance:
                         continue
-                    if (head, tail) in available_relation_mapping:
-                        num_relations_in_partition += 1
-                        distances_taken[available_relation_mapping[(head, tail)].label].append(d)
-                        available_rels_within_allowed_distance.add(
-                            available_relation_mapping[(head, tail)]
-                        )
+                    available_relation = available_relation_mapping.get((head, tail))
+                    if available_relation is not None:
+                        num_available_rels_within_allowed_distance += 1
+                        if collect_statistics:
+                            distances_taken[available_relation.label].append(d)
+                            available_rels_within_allowed_distance.add(available_relation)
                         continue
                     candidates_with_distance[(head, tail)] = d
         if self.sort_by_distance:
@@ -199,7 +223,8 @@ class CandidateRelationAdder(EnterDatasetMixin, ExitDatasetMixin):
         for (head, tail), d in candidates_with_distance_list:
             new_relation = BinaryRelation(label=self.label, head=head, tail=tail)
             rel_layer.append(new_relation)
-            distances_taken[self.label].append(d)
+            if collect_statistics:
+                distances_taken[self.label].append(d)
             n_added += 1
 
         if self.collect_statistics:
@@ -212,7 +237,7 @@ class CandidateRelationAdder(EnterDatasetMixin, ExitDatasetMixin):
                 set(available_relation_mapping.values()) - available_rels_within_allowed_distance
             )
 
-            num_rels_within_allowed_distance = sum(len(v) for v in distances_taken.values())
+            num_rels_within_allowed_distance = num_available_rels_within_allowed_distance + n_added
             self.update_statistics(
                 "num_rels_within_allowed_distance", num_rels_within_allowed_distance
             )
@@ -221,9 +246,9 @@ class CandidateRelationAdder(EnterDatasetMixin, ExitDatasetMixin):
             )
             num_added_relation_not_taken = num_total_candidates - num_rels_taken
             self.update_statistics("num_added_relation_not_taken", num_added_relation_not_taken)
-            num_candidates_not_taken: dict[str, int] = defaultdict(lambda: 0)
-            for rel in available_rels_exceeding_allowed_distance:
-                num_candidates_not_taken[rel.label] += 1
+            num_candidates_not_taken: dict[str, int] = Counter(
+                rel.label for rel in available_rels_exceeding_allowed_distance
+            )
             num_candidates_not_taken[self.label] = num_added_relation_not_taken
             self.update_statistics("num_candidates_not_taken", num_candidates_not_taken)
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import array
 import json
 import logging
 import re
 import statistics
-from typing import Any, Callable, Iterable, Iterator, Match, TypeVar
+from typing import Callable, Iterable, Iterator, Match, Pattern, TypeVar
 
 from pytorch_ie import Dataset, IterableDataset
 from pytorch_ie.annotations import LabeledSpan
@@ -17,8 +18,17 @@ logger = logging.getLogger(__name__)
 D = TypeVar("D", bound=TextBasedDocument)
 
 
-def create_regex_matcher(pattern):
-    return re.compile(pattern).finditer
+def create_regex_matcher(pattern: str | Pattern) -> Callable[[str], Iterable[Match]]:
+    """This method creates a matcher from a regular expression. A string is compiled with the re
+    module. A pattern object that is already compiled, e.g. with re, regex, or re2 (google-re2), is
+    used as it is. This allows to use other regular expression engines as long as they provide a
+    finditer() method that yields match objects.
+
+    :param pattern: A string or a compiled pattern object with a finditer() method.
+    """
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    return pattern.finditer
 
 
 def strip_span(start: int, end: int, text: str) -> tuple[int, int]:
@@ -28,9 +38,13 @@ def strip_span(start: int, end: int, text: str) -> tuple[int, int]:
     :param end: An integer value that represents the end index of the span.
     :param text: A string value that represents the text from which the span is extracted.
     """
-    span_text = text[start:end]
-    new_start = start + len(span_text) - len(span_text.lstrip())
-    new_end = end - len(span_text) + len(span_text.rstrip())
+    # move the offsets over the whitespace instead of copying the (potentially long) span text
+    new_start = start
+    while new_start < end and text[new_start].isspace():
+        new_start += 1
+    new_end = end
+    while new_end > new_start and text[new_end - 1].isspace():
+        new_end -= 1
     # if the span is empty, then create a span of length 0 at the start index
     if new_start >= new_end:
         new_start = start
@@ -82,9 +96,11 @@ def _get_partitions_with_matcher(
         matcher = matcher_or_pattern
     if initial_partition_label is None:
         initial_partition_label = default_partition_label
+    # convert the whitelist once, so that checking the label of each match is a set lookup
+    allowed_labels = frozenset(label_whitelist) if label_whitelist is not None else None
     previous_start = previous_label = None
     if not skip_initial_partition:
-        if label_whitelist is None or initial_partition_label in label_whitelist:
+        if allowed_labels is None or initial_partition_label in allowed_labels:
             previous_start = 0
             previous_label = initial_partition_label
     for match in matcher(text):
@@ -94,7 +110,7 @@ def _get_partitions_with_matcher(
             label = text[start:end]
         else:
             label = default_partition_label
-        if label_whitelist is None or label in label_whitelist:
+        if allowed_labels is None or label in allowed_labels:
             if previous_start is not None and previous_label is not None:
                 start = previous_start
                 end = match.start()
@@ -134,19 +150,23 @@ class RegexPartitioner(EnterDatasetMixin, ExitDatasetMixin):
     For more information, refer to get_partitions_with_matcher() method.
 
     :param pattern: A regular expression to search for in the text. It is also included at the beginning of each partition.
+                    It can be a string or an already compiled pattern object with a finditer() method, e.g. from
+                    the regex or re2 (google-re2) packages, see create_regex_matcher().
     :param collect_statistics: A boolean value (default:False) that allows to collect relevant statistics of the
                                 document after partitioning. When this parameter is enabled, following stats are
                                 collected:
-                                1. partition_lengths: list of lengths of all partitions
-                                2. num_partitions: list of number of partitions in each document
-                                3. document_lengths: list of document lengths
-                                show_statistics can be used to get statistical insight over these lists.
+                                1. partition_lengths: lengths of all partitions
+                                2. num_partitions: number of partitions in each document
+                                3. document_lengths: document lengths
+                                These are stored as integer arrays (array.array("q")), not as lists, so
+                                update_statistics only accepts integers or lists of integers.
+                                show_statistics can be used to get statistical insight over these arrays.
     :param partitioner_kwargs: keyword arguments for get_partitions_with_matcher() method
     """
 
     def __init__(
         self,
-        pattern: str,
+        pattern: str | Pattern,
         collect_statistics: bool = False,
         partition_layer_name: str = "partitions",
         text_field_name: str = "text",
@@ -160,10 +180,11 @@ class RegexPartitioner(EnterDatasetMixin, ExitDatasetMixin):
         self.partitioner_kwargs = partitioner_kwargs
 
     def reset_statistics(self):
-        self._statistics: dict[str, Any] = {
-            "partition_lengths": [],
-            "num_partitions": [],
-            "document_lengths": [],
+        # the statistics are plain integers, so store them compactly in arrays instead of lists
+        self._statistics: dict[str, array.array] = {
+            "partition_lengths": array.array("q"),
+            "num_partitions": array.array("q"),
+            "document_lengths": array.array("q"),
         }
 
     def show_statistics(self, description: str | None = None):
@@ -180,11 +201,11 @@ class RegexPartitioner(EnterDatasetMixin, ExitDatasetMixin):
 
         logger.info(f"{description}: \n{json.dumps(statistics_show, indent=2)}")
 
-    def update_statistics(self, key: str, value: int | str | list):
+    def update_statistics(self, key: str, value: int | list[int]):
         if self.collect_statistics:
             if isinstance(value, list):
-                self._statistics[key] += value
-            elif isinstance(value, str) or isinstance(value, int):
+                self._statistics[key].extend(value)
+            elif isinstance(value, int):
                 self._statistics[key].append(value)
             else:
                 raise TypeError(
@@ -194,14 +215,15 @@ class RegexPartitioner(EnterDatasetMixin, ExitDatasetMixin):
     def __call__(self, document: D) -> D:
         partition_lengths = []
         text: str = getattr(document, self.text_field_name)
+        partition_layer = document[self.partition_layer_name]
         for partition in _get_partitions_with_matcher(
             text=text, matcher_or_pattern=self.matcher, **self.partitioner_kwargs
         ):
-            document[self.partition_layer_name].append(partition)
+            partition_layer.append(partition)
             partition_lengths.append(partition.end - partition.start)
 
         if self.collect_statistics:
-            self.update_statistics("num_partitions", len(document[self.partition_layer_name]))
+            self.update_statistics("num_partitions", len(partition_lengths))
             self.update_statistics("partition_lengths", partition_lengths)
             self.update_statistics("document_lengths", len(text))
 
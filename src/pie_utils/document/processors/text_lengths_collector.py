@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import statistics
@@ -9,7 +10,7 @@ from pytorch_ie import Dataset, IterableDataset
 from pytorch_ie.annotations import Span
 from pytorch_ie.core import Document
 from pytorch_ie.data.common import EnterDatasetMixin, ExitDatasetMixin
-from transformers import AutoTokenizer
+from transformers import AutoTokenizer, PreTrainedTokenizerBase
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,12 @@ logger = logging.getLogger(__name__)
 D = TypeVar("D", bound=Document)
 
 
+@functools.lru_cache(maxsize=8)
+def _get_tokenizer(tokenizer_name_or_path: str) -> PreTrainedTokenizerBase:
+    # loading a tokenizer is expensive, so share it between all collectors that use the same one
+    return AutoTokenizer.from_pretrained(tokenizer_name_or_path)
+
+
 class TextLengthsCollector(EnterDatasetMixin, ExitDatasetMixin):
     """This document processor collects the text lengths in means of token numbers and allows to
     show them as json dict and, if plotext is installed, as histogram. Its nature is purely
@@ -45,7 +52,7 @@ class TextLengthsCollector(EnterDatasetMixin, ExitDatasetMixin):
     ):
         self.partition_layer = partition_layer
         self.tokenizer_name_or_path = tokenizer_name_or_path
-        self.tokenizer = AutoTokenizer.from_pretrained(self.tokenizer_name_or_path)
+        self.tokenizer = _get_tokenizer(self.tokenizer_name_or_path)
         self.tokenizer_kwargs = tokenizer_kwargs or {}
         self.plotext_kwargs = plotext_kwargs or {}
         self.reset_statistics()
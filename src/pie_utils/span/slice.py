@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Callable, Dict, Tuple
 
 
 def get_overlap_len(indices_1: Tuple[int, int], indices_2: Tuple[int, int]) -> int:
@@ -24,37 +24,46 @@ def is_contained_in(start_end: Tuple[int, int], other_start_end: Tuple[int, int]
 
 
 def distance_center(start_end: Tuple[int, int], other_start_end: Tuple[int, int]) -> float:
-    center = (start_end[0] + start_end[1]) / 2
-    center_other = (other_start_end[0] + other_start_end[1]) / 2
-    return abs(center - center_other)
+    start, end = start_end
+    other_start, other_end = other_start_end
+    # difference of the doubled centers, i.e. (start + end) / 2 - (other_start + other_end) / 2
+    return abs(start + end - other_start - other_end) / 2
 
 
 def distance_outer(start_end: Tuple[int, int], other_start_end: Tuple[int, int]) -> float:
-    _max = max(start_end[0], start_end[1], other_start_end[0], other_start_end[1])
-    _min = min(start_end[0], start_end[1], other_start_end[0], other_start_end[1])
-    return float(_max - _min)
+    start, end = start_end
+    other_start, other_end = other_start_end
+    return float(max(start, end, other_start, other_end) - min(start, end, other_start, other_end))
 
 
 def distance_inner(start_end: Tuple[int, int], other_start_end: Tuple[int, int]) -> float:
-    dist_start_other_end = abs(start_end[0] - other_start_end[1])
-    dist_end_other_start = abs(start_end[1] - other_start_end[0])
-    dist = float(min(dist_start_other_end, dist_end_other_start))
+    start, end = start_end
+    other_start, other_end = other_start_end
+    dist = float(min(abs(start - other_end), abs(end - other_start)))
     if not have_overlap(start_end, other_start_end):
         return dist
     else:
         return -dist
 
 
+DISTANCE_FUNCTIONS: Dict[str, Callable[[Tuple[int, int], Tuple[int, int]], float]] = {
+    "center": distance_center,
+    "inner": distance_inner,
+    "outer": distance_outer,
+}
+
+
+def get_distance_function(
+    distance_type: str,
+) -> Callable[[Tuple[int, int], Tuple[int, int]], float]:
+    if distance_type not in DISTANCE_FUNCTIONS:
+        raise ValueError(
+            f"unknown distance_type={distance_type}. use one of: {', '.join(DISTANCE_FUNCTIONS)}"
+        )
+    return DISTANCE_FUNCTIONS[distance_type]
+
+
 def distance(
     start_end: Tuple[int, int], other_start_end: Tuple[int, int], distance_type: str
 ) -> float:
-    if distance_type == "center":
-        return distance_center(start_end, other_start_end)
-    elif distance_type == "inner":
-        return distance_inner(start_end, other_start_end)
-    elif distance_type == "outer":
-        return distance_outer(start_end, other_start_end)
-    else:
-        raise ValueError(
-            f"unknown distance_type={distance_type}. use one of: center, inner, outer"
-        )
+    return get_distance_function(distance_type)(start_end, other_start_end)
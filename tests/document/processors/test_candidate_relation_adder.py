@@ -1,4 +1,3 @@
-import copy
 import json
 import logging
 from dataclasses import dataclass
@@ -68,18 +67,16 @@ def test_candidate_relation_adder(document1):
     )
     document = document1
 
-    original_document = copy.deepcopy(document)
+    original_relations = list(document.relations)
     document = candidate_relation_adder(document)
     assert len(document) == 3
 
     # Document contains three entities, therefore total number of relations would be 6. One relation was already
     # available in the document, so 5 new relation candidates added.
-    original_document = original_document
     entities = document.entities
     assert len(entities) == 3
     relations = document.relations
     assert len(relations) == 6
-    original_relations = original_document.relations
     assert len(original_relations) == 1
     assert str(relations[0]) == str(original_relations[0])
     relation = relations[1]
@@ -125,18 +122,16 @@ def test_candidate_relation_adder_use_predictions():
     document.relations.predictions.append(REL_JANE_LIVES_IN_BERLIN)
     document.partitions.append(SENTENCE1_TEXT1)
 
-    original_document = copy.deepcopy(document)
+    original_relations = list(document.relations.predictions)
     document = candidate_relation_adder(document)
     assert len(document) == 3
 
     # Document contains three entities, therefore total number of relations would be 6. One relation was already
     # available in the document, so 5 new relation candidates added.
-    original_document = original_document
     entities = document.entities.predictions
     assert len(entities) == 3
     relations = document.relations.predictions
     assert len(relations) == 6
-    original_relations = original_document.relations.predictions
     assert len(original_relations) == 1
     assert str(relations[0]) == str(original_relations[0])
     relation = relations[1]
@@ -205,18 +200,16 @@ def test_candidate_relation_adder_without_sort_by_distance(document1):
 
     document = document1
 
-    original_document = copy.deepcopy(document)
+    original_relations = list(document.relations)
     document = candidate_relation_adder_without_sort_by_distance(document)
     assert len(document) == 3
 
     # Document contains three entities, therefore total number of relations would be 6. One relation was already
     # available in the document, so 5 new relation candidates added.
-    original_document = original_document
     entities = document.entities
     assert len(entities) == 3
     relations = document.relations
     assert len(relations) == 6
-    original_relations = original_document.relations
     assert len(original_relations) == 1
     assert str(relations[0]) == str(original_relations[0])
     relation = relations[1]
@@ -239,19 +232,17 @@ def test_candidate_relation_adder_with_n_max_factor(document1):
 
     document = document1
 
-    original_document = copy.deepcopy(document)
+    original_relations = list(document.relations)
     document = candidate_relation_adder_with_no_relation_upper_bound(document)
     assert len(document) == 3
 
     # Document contains three entities, therefore total number of relations would be 6. One relation was already
     # available in the document but since we limit total number of no relation added by a threshold 3, therefore
     # total available relations after processing will be 4.
-    original_document = original_document
     entities = document.entities
     assert len(entities) == 3
     relations = document.relations
     assert len(relations) == 4  # one original and three no_relation
-    original_relations = original_document.relations
     assert len(original_relations) == 1
     assert str(relations[0]) == str(original_relations[0])
     relation = relations[1]
@@ -269,18 +260,16 @@ def test_candidate_relation_adder_with_n_max(document1):
 
     document = document1
 
-    original_document = copy.deepcopy(document)
+    original_relations = list(document.relations)
     document = candidate_relation_adder(document)
     assert len(document) == 3
 
     # Document contains three entities, therefore total number of relations would be 6. One relation was already
     # available in the document, so 5 new relation candidates added.
-    original_document = original_document
     entities = document.entities
     assert len(entities) == 3
     relations = document.relations
     assert len(relations) == 4
-    original_relations = original_document.relations
     assert len(original_relations) == 1
     assert str(relations[0]) == str(original_relations[0])
     relation = relations[1]
@@ -299,19 +288,17 @@ def test_candidate_relation_adder_with_partitions(document2):
 
     document = document2
 
-    original_document = copy.deepcopy(document)
+    original_relations = list(document.relations)
     candidate_relation_adder_with_partition(document)
     assert len(document) == 3
 
     # Document contains two partitions, both containing one entity. Since there is no entity pair in any partition,
     # therefore, no new relation candidate is possible.
 
-    original_document = original_document
     entities = document.entities
     assert len(entities) == 2
     relations = document.relations
     assert len(relations) == 1
-    original_relations = original_document.relations
     assert len(original_relations) == 1
     assert str(relations[0]) == str(original_relations[0])
     partition = document.partitions
@@ -329,23 +316,57 @@ def test_candidate_relation_adder_with_partitions_and_max_distance(document3):
 
     document = document3
 
-    original_document = copy.deepcopy(document)
+    original_relations = list(document.relations)
     candidate_relation_adder_with_partition_and_max_distance(document)
     assert len(document) == 3
 
     # Document contains two candidate entity pairs with span distance 22 which is greater than maximum allowed span
     # distance, there none of these entity pairs are added as relation candidates.
-    original_document = original_document
     entities = document.entities
     assert len(entities) == 2
     relations = document.relations
     assert len(relations) == 0
-    original_relations = original_document.relations
     assert len(original_relations) == 0
     partition = document.partitions
     assert len(partition) == 1
 
 
+def test_candidate_relation_adder_with_overlapping_partitions():
+    candidate_relation_adder = CandidateRelationAdder(
+        label="no_relation",
+        partition_layer="partitions",
+    )
+    document = DocumentWithEntitiesRelationsAndPartitions(text="Jane lives in Berlin. Karl too.")
+    document.entities.extend(
+        [
+            LabeledSpan(start=0, end=4, label="person"),
+            LabeledSpan(start=14, end=20, label="city"),
+            LabeledSpan(start=22, end=26, label="person"),
+        ]
+    )
+    document.partitions.extend(
+        [
+            LabeledSpan(start=0, end=21, label="sentence"),
+            LabeledSpan(start=10, end=31, label="sentence"),
+        ]
+    )
+    assert [str(partition) for partition in document.partitions] == [
+        "Jane lives in Berlin.",
+        " in Berlin. Karl too.",
+    ]
+
+    candidate_relation_adder(document)
+
+    # Berlin is contained in both partitions, so it is paired with Jane (first partition) and with
+    # Karl (second partition). Jane and Karl do not share a partition, so they are not paired.
+    assert [(str(rel.head), str(rel.tail)) for rel in document.relations] == [
+        ("Berlin", "Karl"),
+        ("Karl", "Berlin"),
+        ("Jane", "Berlin"),
+        ("Berlin", "Jane"),
+    ]
+
+
 def test_rel_layer_with_multiple_target_layers():
     @dataclass
     class MyDocument(TextDocument):
@@ -365,3 +386,9 @@ def test_rel_layer_with_multiple_target_layers():
             == "Relation layer must have exactly one target layer but found the following target layers: "
             "['entities1', 'entities2']"
         )
+
+
+def test_candidate_relation_adder_with_unknown_distance_type():
+    with pytest.raises(ValueError) as e:
+        CandidateRelationAdder(distance_type="unknown")
+    assert str(e.value) == "unknown distance_type=unknown. use one of: center, inner, outer"
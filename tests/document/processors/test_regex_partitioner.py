@@ -1,21 +1,28 @@
 import json
 import logging
+import re
 
 import pytest
 from pytorch_ie.annotations import LabeledSpan
 
 from pie_utils.document.processors import RegexPartitioner
 from pie_utils.document.processors.regex_partitioner import _get_partitions_with_matcher
-from pie_utils.span.slice import have_overlap
 from tests.document.processors.common import DocumentWithPartitions
 
+TEXT1 = (
+    "This is initial text.<start>Jane lives in Berlin. this is no sentence about Karl."
+    "<middle>Seattle is a rainy city. Jenny Durkan is the city's mayor."
+    "<end>Karl enjoys sunny days in Berlin."
+)
+TEXT2 = "This is initial text.<start>Lily is mother of Harry.<end>Beth greets Emma."
+TEXT3 = (
+    "\nThis is initial text. Jane lives in Berlin. this is no sentence about Karl.\n"
+    "Seattle is a rainy city. Jenny Durkan is the city's mayor.\n\n"
+    "Karl enjoys sunny days in Berlin.\n"
+)
+
 
 def test_regex_partitioner():
-    TEXT1 = (
-        "This is initial text.<start>Jane lives in Berlin. this is no sentence about Karl."
-        "<middle>Seattle is a rainy city. Jenny Durkan is the city's mayor."
-        "<end>Karl enjoys sunny days in Berlin."
-    )
     regex_partitioner = RegexPartitioner(
         pattern="(<start>|<middle>|<end>)",
     )
@@ -36,14 +43,27 @@ def test_regex_partitioner():
     assert str(partitions[3]) == "<end>Karl enjoys sunny days in Berlin."
 
 
-def test_regex_partitioner_with_statistics(caplog):
-    TEXT1 = (
-        "This is initial text.<start>Jane lives in Berlin. this is no sentence about Karl."
-        "<middle>Seattle is a rainy city. Jenny Durkan is the city's mayor."
-        "<end>Karl enjoys sunny days in Berlin."
+def test_regex_partitioner_with_compiled_pattern():
+    regex_partitioner = RegexPartitioner(
+        pattern=re.compile("(<start>|<middle>|<end>)"),
+        label_group_id=0,
     )
-    TEXT2 = "This is initial text.<start>Lily is mother of Harry.<end>Beth greets Emma."
+    # A compiled pattern is used as it is, so the result is the same as when passing the pattern as string.
+    document = DocumentWithPartitions(text=TEXT1)
+    new_document = regex_partitioner(document)
 
+    partitions = new_document.partitions
+    labels = [partition.label for partition in partitions]
+    assert labels == ["partition", "<start>", "<middle>", "<end>"]
+    assert str(partitions[0]) == "This is initial text."
+    assert str(partitions[1]) == "<start>Jane lives in Berlin. this is no sentence about Karl."
+    assert (
+        str(partitions[2]) == "<middle>Seattle is a rainy city. Jenny Durkan is the city's mayor."
+    )
+    assert str(partitions[3]) == "<end>Karl enjoys sunny days in Berlin."
+
+
+def test_regex_partitioner_with_statistics(caplog):
     regex_partitioner = RegexPartitioner(
         pattern="(<start>|<middle>|<end>)",
         label_group_id=0,
@@ -111,11 +131,6 @@ def test_regex_partitioner_with_statistics(caplog):
 @pytest.mark.parametrize("label_whitelist", [["<start>", "<middle>", "<end>"], [], None])
 @pytest.mark.parametrize("skip_initial_partition", [True, False])
 def test_regex_partitioner_without_label_group_id(label_whitelist, skip_initial_partition):
-    TEXT1 = (
-        "This is initial text.<start>Jane lives in Berlin. this is no sentence about Karl."
-        "<middle>Seattle is a rainy city. Jenny Durkan is the city's mayor."
-        "<end>Karl enjoys sunny days in Berlin."
-    )
     regex_partitioner = RegexPartitioner(
         pattern="(<start>|<middle>|<end>)",
         label_whitelist=label_whitelist,
@@ -171,11 +186,6 @@ def test_regex_partitioner_without_label_group_id(label_whitelist, skip_initial_
 )
 @pytest.mark.parametrize("skip_initial_partition", [True, False])
 def test_regex_partitioner_with_label_group_id(label_whitelist, skip_initial_partition):
-    TEXT1 = (
-        "This is initial text.<start>Jane lives in Berlin. this is no sentence about Karl."
-        "<middle>Seattle is a rainy city. Jenny Durkan is the city's mayor."
-        "<end>Karl enjoys sunny days in Berlin."
-    )
     regex_partitioner = RegexPartitioner(
         pattern="(<start>|<middle>|<end>)",
         label_group_id=0,
@@ -264,7 +274,6 @@ def test_regex_partitioner_with_label_group_id(label_whitelist, skip_initial_par
 @pytest.mark.parametrize("label_whitelist", [["partition"], [], None])
 @pytest.mark.parametrize("skip_initial_partition", [True, False])
 def test_regex_partitioner_with_no_match_found(skip_initial_partition, label_whitelist):
-    TEXT2 = "This is initial text.<start>Lily is mother of Harry.<end>Beth greets Emma."
     regex_partitioner = RegexPartitioner(
         pattern="(<middle>)",
         label_group_id=0,
@@ -306,26 +315,25 @@ def test_regex_partitioner_with_no_match_found(skip_initial_partition, label_whi
 
 
 def test_get_partitions_with_matcher():
-    TEXT1 = (
-        "This is initial text.<start>Jane lives in Berlin. this is no sentence about Karl."
-        "<middle>Seattle is a rainy city. Jenny Durkan is the city's mayor."
-        "<end>Karl enjoys sunny days in Berlin."
-    )
     # The document contains a text separated by some markers like <start>, <middle> and <end>. finditer method is used
     # which returns non overlapping match from the text. Therefore, none of the partition created should have overlapped
     # span and all of them should be instances of LabeledSpan.
     document = DocumentWithPartitions(text=TEXT1)
-    partitions = []
-    for partition in _get_partitions_with_matcher(
-        text=document.text,
-        matcher_or_pattern="(<start>|<middle>|<end>)",
-        label_group_id=0,
-        label_whitelist=["<start>", "<middle>", "<end>"],
-    ):
+    partitions = list(
+        _get_partitions_with_matcher(
+            text=document.text,
+            matcher_or_pattern="(<start>|<middle>|<end>)",
+            label_group_id=0,
+            label_whitelist=["<start>", "<middle>", "<end>"],
+        )
+    )
+    assert len(partitions) == 3
+    previous_end = 0
+    for partition in partitions:
         assert isinstance(partition, LabeledSpan)
-        for p in partitions:
-            assert not have_overlap((p.start, p.end), (partition.start, partition.end))
-        partitions.append(partition)
+        # partitions are yielded in text order, so it is sufficient to compare with the previous one
+        assert partition.start >= previous_end
+        previous_end = partition.end
 
 
 @pytest.mark.parametrize(
@@ -338,17 +346,12 @@ def test_get_partitions_with_matcher():
     ],
 )
 def test_regex_partitioner_with_strip_whitespace(strip_whitespace, verbose, caplog):
-    TEXT1 = (
-        "\nThis is initial text. Jane lives in Berlin. this is no sentence about Karl.\n"
-        "Seattle is a rainy city. Jenny Durkan is the city's mayor.\n\n"
-        "Karl enjoys sunny days in Berlin.\n"
-    )
     regex_partitioner = RegexPartitioner(
         pattern="\n",
         strip_whitespace=strip_whitespace,
         verbose=verbose,
     )
-    document = DocumentWithPartitions(text=TEXT1)
+    document = DocumentWithPartitions(text=TEXT3)
     new_document = regex_partitioner(document)
 
     partitions = new_document.partitions
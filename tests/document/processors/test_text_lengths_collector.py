@@ -41,3 +41,12 @@ def test_text_lengths_collector_with_partition():
     assert text_lengths_collector.num_docs == 1
     assert text_lengths_collector.num_parts == 2
     text_lengths_collector.exit_dataset(None)
+
+
+def test_text_lengths_collector_shares_tokenizer():
+    text_lengths_collector = TextLengthsCollector(tokenizer_name_or_path="bert-base-uncased")
+    other_text_lengths_collector = TextLengthsCollector(
+        tokenizer_name_or_path="bert-base-uncased", partition_layer="partitions"
+    )
+    # the tokenizer is loaded only once and shared between collectors that use the same one
+    assert text_lengths_collector.tokenizer is other_text_lengths_collector.tokenizer
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from types import MappingProxyType
 
 import pytest
 from pytorch_ie.annotations import BinaryRelation, LabeledSpan
@@ -8,24 +9,32 @@ from pytorch_ie.documents import TextDocument
 from pie_utils.document.visualization import print_document_annotation_graph
 
 
+@dataclass
+class MyDocument(TextDocument):
+    entities: AnnotationList[LabeledSpan] = annotation_field(target="text")
+    relations: AnnotationList[BinaryRelation] = annotation_field(target="entities")
+    partitions: AnnotationList[LabeledSpan] = annotation_field(target="text")
+    entity_belongs_to_partition: AnnotationList[BinaryRelation] = annotation_field(
+        targets=["entities", "partitions"]
+    )
+
+
+@pytest.fixture(scope="module")
+def annotation_graph():
+    # the annotation graph depends only on the document type, so it can be shared between tests.
+    # It is frozen (read-only mapping with tuples as values) to make sure that no test case
+    # modifies it for the following ones.
+    annotation_graph = MyDocument(text="Hello World")._annotation_graph
+    return MappingProxyType({name: tuple(targets) for name, targets in annotation_graph.items()})
+
+
 @pytest.mark.parametrize(
     "swap_edges",
     [True, False],
 )
-def test_print_document_annotation_graph(swap_edges):
-    @dataclass
-    class MyDocument(TextDocument):
-        entities: AnnotationList[LabeledSpan] = annotation_field(target="text")
-        relations: AnnotationList[BinaryRelation] = annotation_field(target="entities")
-        partitions: AnnotationList[LabeledSpan] = annotation_field(target="text")
-        entity_belongs_to_partition: AnnotationList[BinaryRelation] = annotation_field(
-            targets=["entities", "partitions"]
-        )
-
-    document = MyDocument(text="Hello World")
-
+def test_print_document_annotation_graph(swap_edges, annotation_graph):
     print_document_annotation_graph(
-        annotation_graph=document._annotation_graph,
+        annotation_graph=annotation_graph,
         remove_node="_artificial_root",
         add_root_node="root",
         swap_edges=swap_edges,
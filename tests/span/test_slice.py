@@ -3,9 +3,6 @@ from pytorch_ie.utils.span import has_overlap
 
 from pie_utils.span.slice import (
     distance,
-    distance_center,
-    distance_inner,
-    distance_outer,
     get_overlap_len,
     is_contained_in,
 )
@@ -103,74 +100,37 @@ def test_is_contained_in():
     assert not is_contained_in(start_end, other_start_end)
 
 
-def test_distance_center():
-    distance = distance_center(start_end=(0, 4), other_start_end=(6, 10))
-    assert distance == 6.0
-    distance = distance_center(start_end=(6, 10), other_start_end=(0, 4))
-    assert distance == 6.0
-
-
-def test_distance_center_with_overlap():
-    # center0 = (0 + 4) / 2  # 2
-    # center1 = (2 + 6) / 2  # 4
-    distance = distance_center(start_end=(0, 4), other_start_end=(2, 6))
-    assert distance == 2.0
-
-    # center0 = (0 + 6) / 2  # 3
-    # center1 = (1 + 2) / 2  # 1.5
-    distance = distance_center(start_end=(0, 6), other_start_end=(1, 2))
-    assert distance == 1.5
-
-
-def test_distance_outer():
-    distance = distance_outer(start_end=(0, 4), other_start_end=(6, 10))
-    assert distance == 10.0
-    distance = distance_outer(start_end=(6, 10), other_start_end=(0, 4))
-    assert distance == 10.0
-
-
-def test_distance_outer_with_overlap():
-    distance = distance_outer(start_end=(0, 4), other_start_end=(2, 6))
-    assert distance == 6.0
-
-    distance = distance_outer(start_end=(0, 6), other_start_end=(1, 2))
-    assert distance == 6.0
-
-
-def test_distance_inner():
-    distance = distance_inner(start_end=(4, 6), other_start_end=(0, 3))
-    assert distance == 1
-
-    distance = distance_inner(start_end=(0, 3), other_start_end=(4, 6))
-    assert distance == 1
-
-    distance = distance_inner(start_end=(0, 4), other_start_end=(4, 6))
-    assert distance == 0
-
-
-def test_distance_inner_with_overlap():
-    distance = distance_inner(start_end=(0, 4), other_start_end=(2, 6))
-    assert distance == -2
-
-    distance = distance_inner(start_end=(0, 6), other_start_end=(1, 2))
-    assert distance == -2
-
-    distance = distance_inner(start_end=(0, 4), other_start_end=(4, 6))
-    assert distance == 0
+DISTANCE_CASES = [
+    ("center", (0, 4), (6, 10), 6.0),
+    ("center", (6, 10), (0, 4), 6.0),
+    # with overlap: center (0 + 4) / 2 = 2 and center (2 + 6) / 2 = 4
+    ("center", (0, 4), (2, 6), 2.0),
+    # with overlap: center (0 + 6) / 2 = 3 and center (1 + 2) / 2 = 1.5
+    ("center", (0, 6), (1, 2), 1.5),
+    ("outer", (0, 4), (6, 10), 10.0),
+    ("outer", (6, 10), (0, 4), 10.0),
+    # with overlap
+    ("outer", (0, 4), (2, 6), 6.0),
+    ("outer", (0, 6), (1, 2), 6.0),
+    ("inner", (0, 4), (6, 10), 2.0),
+    ("inner", (4, 6), (0, 3), 1.0),
+    ("inner", (0, 3), (4, 6), 1.0),
+    ("inner", (0, 4), (4, 6), 0.0),
+    # with overlap
+    ("inner", (0, 4), (2, 6), -2.0),
+    ("inner", (0, 6), (1, 2), -2.0),
+]
+
+
+@pytest.mark.parametrize("distance_type,start_end,other_start_end,expected", DISTANCE_CASES)
+def test_distance(distance_type, start_end, other_start_end, expected):
+    distance_ = distance(
+        start_end=start_end, other_start_end=other_start_end, distance_type=distance_type
+    )
+    assert distance_ == expected
 
 
 def test_distance_unknown():
     with pytest.raises(ValueError) as e:
         distance(start_end=(0, 4), other_start_end=(6, 10), distance_type="unknown")
         assert e.value == "unknown distance_type=unknown. use one of: center, inner, outer"
-
-
-@pytest.mark.parametrize("distance_type", ["inner", "outer", "center"])
-def test_distance(distance_type):
-    distance_ = distance(start_end=(0, 4), other_start_end=(6, 10), distance_type=distance_type)
-    if distance_type == "inner":
-        assert distance_ == 2.0
-    elif distance_type == "outer":
-        assert distance_ == 10.0
-    else:
-        assert distance_ == 6.0